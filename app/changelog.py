@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from typing import List, Optional
+
+from app.models import Change
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class ChangeLog:
+    """Monotonic log of mutations, retained in a bounded ring buffer"""
+
+    def __init__(self, maxlen: int):
+        self._entries: deque[Change] = deque(maxlen=maxlen)
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def last_sequence(self) -> int:
+        """Sequence number of the most recent change (0 if none yet)"""
+        return self._sequence
+
+    def record(self, entity: str, action: str, obj) -> Change:
+        """Append a snapshot of `obj` and wake any waiting consumers"""
+        with self._lock:
+            self._sequence += 1
+            change = Change(
+                sequence=self._sequence,
+                entity=entity,
+                action=action,
+                entity_id=obj.id,
+                data=dict(vars(obj)),
+                timestamp=datetime.now(timezone.utc),
+            )
+            self._entries.append(change)
+            waiters, self._waiters = self._waiters, []
+
+        # Writes happen on threadpool workers, so hand off to each waiter's loop
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+        return change
+
+    def since(self, sequence: int, limit: int) -> Optional[List[Change]]:
+        """Get up to `limit` changes after `sequence`, or None if they were evicted"""
+        with self._lock:
+            if sequence > self._sequence:
+                return None
+            first = self._entries[0].sequence if self._entries else self._sequence + 1
+            if sequence + 1 < first:
+                return None
+            start = sequence + 1 - first
+            return list(islice(self._entries, start, start + limit))
+
+    async def wait(self, sequence: int, timeout: float) -> bool:
+        """Wait until a change after `sequence` is recorded; False on timeout"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._sequence > sequence:
+                return True
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
@@ -1,11 +1,34 @@
-from app.models import User, Event, Speaker, Registration
+from datetime import date
+from itertools import count
+
+from app.models import User, Event, Speaker, Registration, SpeakerAssignment
+from app.changelog import ChangeLog
 
 users: list[User] = []
+active_users: dict[int, User] = {}
 events: list[Event] = []
+event_ids = count(1)
+open_events: dict[int, Event] = {}
+closed_events: dict[int, Event] = {}
+archived_events: list[Event] = []
+event_ids = count(1)
 speakers: list[Speaker] = [
     Speaker(id=1, name="Israel Boluwatife", topic="Full-Stack Web Development"),
     Speaker(id=2, name="Babatunde Taiwo", topic="Cloud Architecture"),
     Speaker(id=3, name="Frank Felix", topic="Machine Learning and AI"),
 ]
+speakers_by_id: dict[int, Speaker] = {speaker.id: speaker for speaker in speakers}
 registrations: list[Registration] = []
+registration_ids = count(1)
+registrations_by_id: dict[int, Registration] = {}
+archived_registrations: list[Registration] = []
+registration_ids = count(1)
+speaker_assignments: dict[int, SpeakerAssignment] = {}
+assignment_ids = count(1)
+event_assignments: dict[int, list[SpeakerAssignment]] = {}
+# Sorted (date, assignment_id) schedules, searched with bisect
+schedule_by_speaker: dict[int, list[tuple[date, int]]] = {}
+schedule_by_location: dict[str, list[tuple[date, int]]] = {}
+schedule_by_date: list[tuple[date, int]] = []
 
+changes = ChangeLog(maxlen=10_000)
@@ -2,7 +2,8 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routes import user, event, speaker, registration
+from app.ratelimit import RateLimitMiddleware
+from app.routes import user, event, speaker, registration, change
 
 
 def create_application():
@@ -11,10 +12,13 @@ def create_application():
     application.include_router(event.router)
     application.include_router(speaker.router)
     application.include_router(registration.router)
+    application.include_router(change.router)
 
     return application
 
 app = create_application()
+# Added before CORS so rejected requests still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 
 class User:
@@ -32,5 +32,20 @@ class Registration:
         self.event_id = event_id
         self.registration_date = registration_date
         self.attended = attended
-        
-        
\ No newline at end of file
+
+
+class Change:
+    def __init__(self, sequence: int, entity: str, action: str, entity_id: int, data: dict, timestamp: datetime):
+        self.sequence = sequence
+        self.entity = entity
+        self.action = action
+        self.entity_id = entity_id
+        self.data = data
+        self.timestamp = timestamp
+
+
+class SpeakerAssignment:
+    def __init__(self, id: int, speaker_id: int, event_id: int):
+        self.id = id
+        self.speaker_id = speaker_id
+        self.event_id = event_id
@@ -0,0 +1,156 @@
+import math
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import FrozenSet, List, Optional, Tuple
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+# (method, path pattern, tokens per second, burst size)
+ROUTE_BUDGETS = [
+    ("POST", r"^/registrations/\d+/register/\d+$", 5, 10),
+    ("GET", r"^/users/search$", 10, 20),
+    ("GET", r"^/speakers/search/", 10, 20),
+]
+DEFAULT_BUDGET = (50, 100)
+MAX_CLIENTS = 10_000
+MAX_IN_FLIGHT = 200
+
+# Only keys on this allow-list get their own buckets; anything else is keyed by IP
+API_KEYS = frozenset(key for key in os.environ.get("API_KEYS", "").split(",") if key)
+
+# Long-lived feed connections are rate limited but do not hold admission slots
+UNMETERED_PREFIXES = ("/changes",)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second"""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def consume(self, now: float) -> float:
+        """Take a token; returns 0 if allowed, else seconds until one is available"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Per-client token buckets with per-route budgets"""
+
+    def __init__(
+        self,
+        budgets: List[Tuple[str, str, float, float]],
+        default: Tuple[float, float],
+        max_clients: int = MAX_CLIENTS,
+    ):
+        self.budgets = [
+            (method, re.compile(pattern), rate, burst)
+            for method, pattern, rate, burst in budgets
+        ]
+        self.default = default
+        self.max_clients = max_clients
+        self.buckets: OrderedDict[tuple, TokenBucket] = OrderedDict()
+
+    def check(self, client: str, method: str, path: str) -> float:
+        """Charge one request to the client; returns seconds to wait if over budget"""
+        budget, (rate, burst) = -1, self.default
+        for index, (budget_method, pattern, budget_rate, budget_burst) in enumerate(self.budgets):
+            if method == budget_method and pattern.match(path):
+                budget, rate, burst = index, budget_rate, budget_burst
+                break
+
+        now = time.monotonic()
+        key = (client, budget)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket(rate, burst, now)
+            # Forget the least recently seen clients so memory stays bounded
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+        return bucket.consume(now)
+
+
+def _client_key(scope, api_keys: FrozenSet[str]) -> str:
+    for name, value in scope["headers"]:
+        if name == b"x-api-key":
+            key = value.decode("latin-1")
+            if key in api_keys:
+                return "key:" + key
+            break
+    client = scope.get("client")
+    return "ip:" + (client[0] if client else "unknown")
+
+
+def _error_response(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "error": {
+                "detail": detail,
+                "type": "http_error"
+            }
+        },
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+
+class RateLimitMiddleware:
+    """ASGI middleware that rejects over-budget clients (429) and sheds load (503)
+
+    Runs on the event loop before routing, so buckets and the in-flight
+    counter are only touched from one thread and need no locking.
+    """
+
+    def __init__(
+        self,
+        app,
+        limiter: Optional[RateLimiter] = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        api_keys: FrozenSet[str] = API_KEYS,
+    ):
+        self.app = app
+        self.limiter = limiter or RateLimiter(ROUTE_BUDGETS, DEFAULT_BUDGET)
+        self.api_keys = api_keys
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        retry_after = self.limiter.check(_client_key(scope, self.api_keys), scope["method"], path)
+        if retry_after:
+            response = _error_response(status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded", retry_after)
+            await response(scope, receive, send)
+            return
+
+        if path.startswith(UNMETERED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        if self.in_flight >= self.max_in_flight:
+            response = _error_response(status.HTTP_503_SERVICE_UNAVAILABLE, "Server is busy, retry shortly", 1)
+            await response(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,55 @@
+from typing import List, Optional
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.database import changes
+from app.services.change import ChangeService
+from app.schemas.change import ChangeResponse
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+change_service = ChangeService()
+
+KEEP_ALIVE_SECONDS = 15
+
+
+@router.get("/", response_model=List[ChangeResponse])
+async def get_changes(
+    since: int = Query(0, ge=0, description="Return changes after this sequence"),
+    limit: int = Query(100, ge=1, le=1000),
+    wait: float = Query(0, ge=0, le=30, description="Seconds to long-poll when no changes are available"),
+):
+    """Get changes after a sequence number (long-poll with `wait`)"""
+    batch = await change_service.wait_for_changes(since, limit, wait)
+    return [ChangeResponse.model_validate(change) for change in batch]
+
+
+@router.get("/stream")
+async def stream_changes(
+    since: Optional[int] = Query(None, ge=0, description="Resume after this sequence (defaults to now)"),
+    last_event_id: Optional[int] = Header(None),
+):
+    """Stream changes as Server-Sent Events"""
+    if last_event_id is not None:
+        since = last_event_id
+    elif since is None:
+        since = changes.last_sequence
+    # Fail fast with 410 before the stream starts if the cursor is gone
+    change_service.get_changes(since, 1)
+
+    async def event_stream():
+        cursor = since
+        while True:
+            try:
+                batch = change_service.get_changes(cursor, 100)
+            except HTTPException:
+                yield "event: reset\ndata: {}\n\n"
+                return
+
+            for change in batch:
+                data = ChangeResponse.model_validate(change).model_dump_json()
+                yield f"id: {change.sequence}\ndata: {data}\n\n"
+                cursor = change.sequence
+
+            if not batch and not await changes.wait(cursor, KEEP_ALIVE_SECONDS):
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -1,11 +1,15 @@
 from typing import List, Optional
+from datetime import date
 from fastapi import APIRouter, HTTPException, Path, Query, status
 from app.services.event import EventService
+from app.services.schedule import ScheduleService
 from app.schemas.event import EventCreate, EventUpdate, EventResponse
 from app.schemas.user import UserResponse
+from app.schemas.speaker import SpeakerResponse
 
 router = APIRouter(prefix="/events", tags=["events"])
 event_service = EventService()
+schedule_service = ScheduleService()
 
 
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
@@ -29,6 +33,22 @@ def get_events(
     return [EventResponse.model_validate(event) for event in events]
 
 
+@router.get("/archived", response_model=List[EventResponse])
+def get_archived_events():
+    """Get all archived events"""
+    events = event_service.get_archived_events()
+    return [EventResponse.model_validate(event) for event in events]
+
+
+@router.post("/archive", response_model=List[EventResponse])
+def archive_closed_events(
+    before: Optional[date] = Query(None, description="Archive closed events dated before this day (defaults to 30 days ago)")
+):
+    """Archive closed events and their registrations out of the active set"""
+    events = event_service.archive_closed_events(before)
+    return [EventResponse.model_validate(event) for event in events]
+
+
 @router.get("/{event_id}", response_model=EventResponse)
 def get_event(event_id: int):
     """Get event by ID"""
@@ -56,6 +76,20 @@ def get_event_attendees(event_id: int):
     return [UserResponse.model_validate(user) for user in attendees]
 
 
+@router.get("/{event_id}/speakers", response_model=List[SpeakerResponse])
+def get_event_speakers(event_id: int):
+    """Get all speakers assigned to an event"""
+    event = event_service.get_event_by_id(event_id)
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found"
+        )
+    
+    speakers = schedule_service.get_event_speakers(event_id)
+    return [SpeakerResponse.model_validate(speaker) for speaker in speakers]
+
+
 @router.put("/{event_id}", response_model=EventResponse)
 def update_event(
     event_id: int,
@@ -71,7 +105,7 @@ def update_event(
     return EventResponse.model_validate(updated_event)
 
 
-@router.put("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.put("/{event_id}/close", status_code=status.HTTP_204_NO_CONTENT)
 def close_event(event_id: int):
     """Close event by ID (soft delete - marks as closed)"""
     success = event_service.close_event(event_id)
@@ -1,7 +1,9 @@
-from typing import List
-from fastapi import APIRouter, Query, status
+from typing import List, Optional
+from fastapi import APIRouter, Query, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from app.services.event import EventService
-from app.schemas.event import RegistrationResponse
+from app.schemas.event import RegistrationResponse, AttendanceBatch, AttendanceResult
 
 router = APIRouter(prefix="/registrations", tags=["registrations"])
 event_service = EventService()
@@ -14,6 +16,13 @@ def get_all_registrations():
     return [RegistrationResponse.model_validate(registration) for registration in registrations]
 
 
+@router.get("/archived", response_model=List[RegistrationResponse])
+def get_archived_registrations(user_id: Optional[int] = Query(None)):
+    """View registrations for archived events"""
+    registrations = event_service.get_archived_registrations(user_id)
+    return [RegistrationResponse.model_validate(registration) for registration in registrations]
+
+
 @router.get("/user/{user_id}", response_model=List[RegistrationResponse])
 def get_user_registrations(user_id: int):
     """View registrations for a specific user"""
@@ -28,6 +37,42 @@ def register_user_to_event(event_id: int, user_id: int):
     return RegistrationResponse.model_validate(registration)
 
 
+@router.put("/attendance", response_model=List[AttendanceResult])
+def mark_attendance_batch(batch: AttendanceBatch):
+    """Mark attendance for many registrations in one call (per-item status)"""
+    results = event_service.mark_attendance_batch(batch.registration_ids)
+    return [AttendanceResult.model_validate(result) for result in results]
+
+
+@router.websocket("/attendance/ws")
+async def attendance_stream(websocket: WebSocket):
+    """Check-in stream for door scanners; each message is an AttendanceBatch"""
+    await websocket.accept()
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            break
+        
+        # Scanners may send the JSON payload as either a text or a binary frame
+        payload = message.get("text")
+        if payload is None:
+            payload = message.get("bytes")
+        try:
+            batch = AttendanceBatch.model_validate_json(payload)
+        except (TypeError, ValueError, ValidationError):
+            await websocket.send_json({
+                "error": {
+                    "detail": "Invalid check-in payload",
+                    "type": "validation_error"
+                }
+            })
+            continue
+        
+        # Same threadpool path as the HTTP endpoint, so check-ins share its lock
+        results = await run_in_threadpool(event_service.mark_attendance_batch, batch.registration_ids)
+        await websocket.send_json(results)
+
+
 @router.put("/{registration_id}/attendance", response_model=RegistrationResponse)
 def mark_attendance(registration_id: int):
     """Mark attendance for a registration (set attended to True)"""
@@ -1,10 +1,14 @@
-from typing import List
+from typing import List, Optional
+from datetime import date, timedelta
 from fastapi import APIRouter, HTTPException, Query, status
 from app.services.speaker import SpeakerService
-from app.schemas.speaker import SpeakerCreate, SpeakerUpdate, SpeakerResponse
+from app.services.schedule import ScheduleService
+from app.schemas.speaker import SpeakerCreate, SpeakerUpdate, SpeakerResponse, SpeakerAssignmentResponse
+from app.schemas.event import EventResponse
 
 router = APIRouter(prefix="/speakers", tags=["speakers"])
 speaker_service = SpeakerService()
+schedule_service = ScheduleService()
 
 
 @router.post("/", response_model=SpeakerResponse, status_code=status.HTTP_201_CREATED)
@@ -35,6 +39,20 @@ def search_speakers_by_topic(topic: str = Query(..., description="Topic to searc
     return [SpeakerResponse.model_validate(speaker) for speaker in speakers]
 
 
+@router.get("/schedule", response_model=List[SpeakerResponse])
+def get_scheduled_speakers(
+    start: Optional[date] = Query(None, description="First day (defaults to Monday of this week)"),
+    end: Optional[date] = Query(None, description="Last day, inclusive (defaults to start + 6 days)"),
+    location: Optional[str] = Query(None, description="Only events at this location (case-insensitive)")
+):
+    """Get speakers at events between two dates"""
+    if start is None:
+        today = date.today()
+        start = today - timedelta(days=today.weekday())
+    speakers = schedule_service.get_speakers_between(start, end, location)
+    return [SpeakerResponse.model_validate(speaker) for speaker in speakers]
+
+
 @router.get("/{speaker_id}", response_model=SpeakerResponse)
 def get_speaker(speaker_id: int):
     """Get speaker by ID"""
@@ -69,3 +87,34 @@ def delete_speaker(speaker_id: int):
             detail="Speaker not found"
         )
 
+
+@router.get("/{speaker_id}/events", response_model=List[EventResponse])
+def get_speaker_events(speaker_id: int):
+    """Get events a speaker is assigned to, in date order"""
+    speaker = speaker_service.get_speaker_by_id(speaker_id)
+    if not speaker:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Speaker not found"
+        )
+    
+    events = schedule_service.get_speaker_events(speaker_id)
+    return [EventResponse.model_validate(event) for event in events]
+
+
+@router.post("/{speaker_id}/events/{event_id}", response_model=SpeakerAssignmentResponse, status_code=status.HTTP_201_CREATED)
+def assign_speaker_to_event(speaker_id: int, event_id: int):
+    """Assign a speaker to an event (rejects double-bookings)"""
+    assignment = schedule_service.assign_speaker(speaker_id, event_id)
+    return SpeakerAssignmentResponse.model_validate(assignment)
+
+
+@router.delete("/{speaker_id}/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
+def unassign_speaker_from_event(speaker_id: int, event_id: int):
+    """Remove a speaker from an event"""
+    success = schedule_service.unassign_speaker(speaker_id, event_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Speaker assignment not found"
+        )
@@ -0,0 +1,15 @@
+from typing import Any, Dict
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class ChangeResponse(BaseModel):
+    sequence: int
+    entity: str
+    action: str
+    entity_id: int
+    data: Dict[str, Any]
+    timestamp: datetime
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,7 @@
-from typing import Optional
+import datetime
+from typing import List, Literal, Optional
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class EventBase(BaseModel):
@@ -16,7 +17,8 @@ class EventCreate(EventBase):
 class EventUpdate(BaseModel):
     title: Optional[str] = None
     location: Optional[str] = None
-    date: Optional[date] = None # type: ignore
+    # Qualified so the annotation is not resolved against this field's own None default
+    date: Optional[datetime.date] = None
 
 
 class EventResponse(EventBase):
@@ -40,3 +42,11 @@ class RegistrationResponse(RegistrationBase):
     class Config:
         from_attributes = True
 
+
+class AttendanceBatch(BaseModel):
+    registration_ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+
+class AttendanceResult(BaseModel):
+    registration_id: int
+    status: Literal["marked", "already_attended", "not_found"]
@@ -22,3 +22,11 @@ class SpeakerResponse(SpeakerBase):
     class Config:
         from_attributes = True
 
+
+class SpeakerAssignmentResponse(BaseModel):
+    id: int
+    speaker_id: int
+    event_id: int
+
+    class Config:
+        from_attributes = True
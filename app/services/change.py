@@ -0,0 +1,26 @@
+from typing import List
+from fastapi import HTTPException, status
+
+from app.models import Change
+from app.database import changes
+
+
+class ChangeService:
+    """Service class for reading the change feed"""
+
+    def get_changes(self, since: int, limit: int) -> List[Change]:
+        """Get changes after a sequence number"""
+        batch = changes.since(since, limit)
+        if batch is None:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Sequence is no longer retained, resync from the current state"
+            )
+        return batch
+
+    async def wait_for_changes(self, since: int, limit: int, timeout: float) -> List[Change]:
+        """Long-poll for changes after a sequence number"""
+        batch = self.get_changes(since, limit)
+        if not batch and timeout > 0 and await changes.wait(since, timeout):
+            batch = self.get_changes(since, limit)
+        return batch
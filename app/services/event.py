@@ -1,10 +1,25 @@
+import threading
 from typing import List, Optional
-from datetime import date
+from datetime import date, timedelta
 from fastapi import HTTPException, status
 
 from app.models import Event, User, Registration
-from app.database import events, users, registrations
+from app.database import (
+    events, event_ids, open_events, closed_events, archived_events,
+    users, registrations, registration_ids, registrations_by_id, archived_registrations, changes,
+)
 from app.schemas.event import EventCreate, EventUpdate
+from app.services.schedule import ScheduleService, schedule_lock
+
+schedule_service = ScheduleService()
+
+ARCHIVE_AFTER_DAYS = 30
+
+# Serialises the attended check-and-set so concurrent scans of one ticket report a single "marked"
+attendance_lock = threading.Lock()
+
+# Guards appends to the hot lists and moves between them and the archive
+storage_lock = threading.Lock()
 
 
 class EventService:
@@ -12,29 +27,26 @@ class EventService:
 
     def create_event(self, event_data: EventCreate) -> Event:
         """Create a new event"""
-        # Generate new ID
-        new_id = len(events) + 1
-        
         event = Event(
-            id=new_id,
+            id=next(event_ids),
             title=event_data.title,
             location=event_data.location,
             date=event_data.date,
         )
-        events.append(event)
+        with storage_lock:
+            events.append(event)
+            open_events[event.id] = event
+        changes.record("event", "created", event)
         return event
 
     def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Get event by ID"""
-        for event in events:
-            if event.id == event_id:
-                return event
-        return None
+        return open_events.get(event_id) or closed_events.get(event_id)
 
     def get_all_events(self, open_only: bool = True) -> List[Event]:
         """Get all events"""
         if open_only:
-            filtered_events = [e for e in events if e.is_open]
+            filtered_events = list(open_events.values())
         else:
             filtered_events = events
         
@@ -50,14 +62,24 @@ class EventService:
         if not event:
             return None
         
-        # Update fields from schema
-        if event_data.title is not None:
-            event.title = event_data.title
-        if event_data.location is not None:
-            event.location = event_data.location
-        if event_data.date is not None:
-            event.date = event_data.date
+        with schedule_lock:
+            # Move speaker bookings first so a double-booking leaves the event unchanged
+            if event_data.date is not None or event_data.location is not None:
+                schedule_service.reschedule_event(
+                    event,
+                    event_data.date if event_data.date is not None else event.date,
+                    event_data.location if event_data.location is not None else event.location,
+                )
+            
+            # Update fields from schema
+            if event_data.title is not None:
+                event.title = event_data.title
+            if event_data.location is not None:
+                event.location = event_data.location
+            if event_data.date is not None:
+                event.date = event_data.date
         
+        changes.record("event", "updated", event)
         return event
 
     def close_event(self, event_id: int) -> bool:
@@ -66,8 +88,50 @@ class EventService:
         if not event:
             return False
         
-        event.is_open = False
+        with storage_lock:
+            event.is_open = False
+            if open_events.pop(event.id, None):
+                closed_events[event.id] = event
+        changes.record("event", "closed", event)
         return True
+
+    def archive_closed_events(self, before: Optional[date] = None) -> List[Event]:
+        """Move closed events dated before `before` and their registrations to the archive"""
+        if before is None:
+            before = date.today() - timedelta(days=ARCHIVE_AFTER_DAYS)
+        
+        with storage_lock:
+            cold_ids = {e.id for e in closed_events.values() if e.date < before}
+            if not cold_ids:
+                return []
+            
+            cold_events = [e for e in events if e.id in cold_ids]
+            cold_registrations = [r for r in registrations if r.event_id in cold_ids]
+            events[:] = [e for e in events if e.id not in cold_ids]
+            registrations[:] = [r for r in registrations if r.event_id not in cold_ids]
+            archived_events.extend(cold_events)
+            archived_registrations.extend(cold_registrations)
+            for registration in cold_registrations:
+                registrations_by_id.pop(registration.id, None)
+            for event in cold_events:
+                closed_events.pop(event.id, None)
+        
+        for event in cold_events:
+            schedule_service.remove_event(event)
+            changes.record("event", "archived", event)
+        for registration in cold_registrations:
+            changes.record("registration", "archived", registration)
+        return cold_events
+
+    def get_archived_events(self) -> List[Event]:
+        """Get all archived events"""
+        return archived_events
+
+    def get_archived_registrations(self, user_id: Optional[int] = None) -> List[Registration]:
+        """Get archived registrations, optionally for a specific user"""
+        if user_id is None:
+            return archived_registrations
+        return [r for r in archived_registrations if r.user_id == user_id]
     
     def get_event_attendees(self, event_id: int) -> List[User]:
         """Get all attendees for an event"""
@@ -116,36 +180,59 @@ class EventService:
                 detail="Event must be open for registration"
             )
 
-        # Check if user is already registered
-        for registration in registrations:
-            if registration.user_id == user_id and registration.event_id == event_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="User already registered for this event"
-                )
-
-        # Create registration
-        new_id = len(registrations) + 1
-        registration = Registration(
-            id=new_id,
-            user_id=user_id,
-            event_id=event_id,
-            registration_date=date.today()
-        )
-        registrations.append(registration)
+        with storage_lock:
+            # Check if user is already registered
+            for registration in registrations:
+                if registration.user_id == user_id and registration.event_id == event_id:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="User already registered for this event"
+                    )
+
+            # Create registration
+            registration = Registration(
+                id=next(registration_ids),
+                user_id=user_id,
+                event_id=event_id,
+                registration_date=date.today()
+            )
+            registrations.append(registration)
+            registrations_by_id[registration.id] = registration
+        changes.record("registration", "created", registration)
         return registration
 
     def mark_attendance(self, registration_id: int) -> Registration:
         """Mark attendance for a registration"""
-        for registration in registrations:
-            if registration.id == registration_id:
+        registration = registrations_by_id.get(registration_id)
+        if not registration:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Registration not found"
+            )
+        
+        with attendance_lock:
+            if not registration.attended:
                 registration.attended = True
-                return registration
+                changes.record("registration", "attended", registration)
+        return registration
+
+    def mark_attendance_batch(self, registration_ids: List[int]) -> List[dict]:
+        """Mark attendance for many registrations at once (idempotent)"""
+        results = []
+        with attendance_lock:
+            for registration_id in registration_ids:
+                registration = registrations_by_id.get(registration_id)
+                if not registration:
+                    result = "not_found"
+                elif registration.attended:
+                    result = "already_attended"
+                else:
+                    registration.attended = True
+                    changes.record("registration", "attended", registration)
+                    result = "marked"
+                results.append({"registration_id": registration_id, "status": result})
         
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Registration not found"
-        )
+        return results
 
     def get_user_registrations(self, user_id: int) -> List[Registration]:
         """Get all registrations for a specific user"""
@@ -0,0 +1,187 @@
+import threading
+from bisect import bisect_left, insort
+from typing import List, Optional
+from datetime import date, timedelta
+from fastapi import HTTPException, status
+
+from app.models import Event, Speaker, SpeakerAssignment
+from app.database import (
+    open_events, closed_events, speakers_by_id,
+    speaker_assignments, assignment_ids, event_assignments,
+    schedule_by_speaker, schedule_by_location, schedule_by_date, changes,
+)
+
+# Held across conflict checks and index updates so concurrent assignments cannot double-book.
+# Re-entrant so EventService.update_event can hold it while moving bookings and event fields together.
+schedule_lock = threading.RLock()
+
+
+def _location_key(location: str) -> str:
+    return location.lower()
+
+
+def _get_event(event_id: int) -> Optional[Event]:
+    return open_events.get(event_id) or closed_events.get(event_id)
+
+
+def _booked_on(schedule: List[tuple], day: date) -> List[int]:
+    """Assignment IDs booked on a given day in a sorted schedule"""
+    booked = []
+    index = bisect_left(schedule, (day,))
+    while index < len(schedule) and schedule[index][0] == day:
+        booked.append(schedule[index][1])
+        index += 1
+    return booked
+
+
+def _remove(schedule: List[tuple], entry: tuple):
+    index = bisect_left(schedule, entry)
+    if index < len(schedule) and schedule[index] == entry:
+        del schedule[index]
+
+
+class ScheduleService:
+    """Service class for speaker-to-event assignments"""
+
+    def _check_conflicts(self, speaker_id: int, event_id: int, day: date):
+        """Raise if the speaker is already booked for another event on this day"""
+        for assignment_id in _booked_on(schedule_by_speaker.get(speaker_id, []), day):
+            if speaker_assignments[assignment_id].event_id != event_id:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Speaker is already booked for another event on this date"
+                )
+
+    def _index(self, assignment: SpeakerAssignment, day: date, location: str):
+        entry = (day, assignment.id)
+        insort(schedule_by_speaker.setdefault(assignment.speaker_id, []), entry)
+        insort(schedule_by_location.setdefault(_location_key(location), []), entry)
+        insort(schedule_by_date, entry)
+
+    def _unindex(self, assignment: SpeakerAssignment, day: date, location: str):
+        entry = (day, assignment.id)
+        _remove(schedule_by_speaker.get(assignment.speaker_id, []), entry)
+        _remove(schedule_by_location.get(_location_key(location), []), entry)
+        _remove(schedule_by_date, entry)
+
+    def assign_speaker(self, speaker_id: int, event_id: int) -> SpeakerAssignment:
+        """Assign a speaker to an event, rejecting double-bookings"""
+        if speaker_id not in speakers_by_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Speaker not found"
+            )
+
+        event = _get_event(event_id)
+        if not event:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found"
+            )
+        if not event.is_open:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Event must be open to assign speakers"
+            )
+
+        with schedule_lock:
+            if any(a.speaker_id == speaker_id for a in event_assignments.get(event_id, [])):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Speaker already assigned to this event"
+                )
+            self._check_conflicts(speaker_id, event_id, event.date)
+
+            assignment = SpeakerAssignment(
+                id=next(assignment_ids),
+                speaker_id=speaker_id,
+                event_id=event_id
+            )
+            speaker_assignments[assignment.id] = assignment
+            event_assignments.setdefault(event_id, []).append(assignment)
+            self._index(assignment, event.date, event.location)
+        changes.record("speaker_assignment", "created", assignment)
+        return assignment
+
+    def unassign_speaker(self, speaker_id: int, event_id: int) -> bool:
+        """Remove a speaker from an event"""
+        with schedule_lock:
+            assignment = next(
+                (a for a in event_assignments.get(event_id, []) if a.speaker_id == speaker_id),
+                None
+            )
+            if not assignment:
+                return False
+
+            event = _get_event(event_id)
+            self._unindex(assignment, event.date, event.location)
+            event_assignments[event_id].remove(assignment)
+            del speaker_assignments[assignment.id]
+        changes.record("speaker_assignment", "deleted", assignment)
+        return True
+
+    def reschedule_event(self, event: Event, new_date: date, new_location: str):
+        """Move an event's assignments to a new date/location, rejecting double-bookings"""
+        with schedule_lock:
+            assignments = event_assignments.get(event.id, [])
+            for assignment in assignments:
+                self._check_conflicts(assignment.speaker_id, event.id, new_date)
+
+            for assignment in assignments:
+                self._unindex(assignment, event.date, event.location)
+                self._index(assignment, new_date, new_location)
+
+    def remove_event(self, event: Event):
+        """Drop all assignments for an event"""
+        with schedule_lock:
+            removed = event_assignments.pop(event.id, [])
+            for assignment in removed:
+                self._unindex(assignment, event.date, event.location)
+                del speaker_assignments[assignment.id]
+
+        for assignment in removed:
+            changes.record("speaker_assignment", "deleted", assignment)
+
+    def remove_speaker(self, speaker_id: int):
+        """Drop all assignments for a speaker"""
+        removed = []
+        with schedule_lock:
+            for _, assignment_id in schedule_by_speaker.pop(speaker_id, []):
+                assignment = speaker_assignments.pop(assignment_id)
+                event_assignments[assignment.event_id].remove(assignment)
+                event = _get_event(assignment.event_id)
+                self._unindex(assignment, event.date, event.location)
+                removed.append(assignment)
+
+        for assignment in removed:
+            changes.record("speaker_assignment", "deleted", assignment)
+
+    def get_speaker_events(self, speaker_id: int) -> List[Event]:
+        """Get a speaker's events in date order"""
+        return [
+            _get_event(speaker_assignments[assignment_id].event_id)
+            for _, assignment_id in schedule_by_speaker.get(speaker_id, [])
+        ]
+
+    def get_event_speakers(self, event_id: int) -> List[Speaker]:
+        """Get speakers assigned to an event"""
+        return [speakers_by_id[a.speaker_id] for a in event_assignments.get(event_id, [])]
+
+    def get_speakers_between(
+        self, start: date, end: Optional[date] = None, location: Optional[str] = None
+    ) -> List[Speaker]:
+        """Get speakers at events between two dates (inclusive), defaulting to a week"""
+        if end is None:
+            end = start + timedelta(days=6)
+
+        schedule = schedule_by_date
+        if location is not None:
+            schedule = schedule_by_location.get(_location_key(location), [])
+
+        low = bisect_left(schedule, (start,))
+        high = bisect_left(schedule, (end + timedelta(days=1),))
+        speaker_ids = dict.fromkeys(
+            speaker_assignments[assignment_id].speaker_id
+            for _, assignment_id in schedule[low:high]
+        )
+        return [speakers_by_id[speaker_id] for speaker_id in speaker_ids]
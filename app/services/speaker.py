@@ -1,8 +1,11 @@
 from typing import List, Optional
 
 from app.models import Speaker
-from app.database import speakers
+from app.database import speakers, speakers_by_id, changes
 from app.schemas.speaker import SpeakerCreate, SpeakerUpdate, SpeakerResponse
+from app.services.schedule import ScheduleService
+
+schedule_service = ScheduleService()
 
 
 class SpeakerService:
@@ -19,11 +22,13 @@ class SpeakerService:
             topic=speaker_data.topic
         )
         speakers.append(speaker)
+        speakers_by_id[speaker.id] = speaker
+        changes.record("speaker", "created", speaker)
         return speaker
     
     def get_speaker_by_id(self, speaker_id: int) -> Optional[Speaker]:
         """Get speaker by ID"""
-        return next((speaker for speaker in speakers if speaker.id == speaker_id), None)
+        return speakers_by_id.get(speaker_id)
     
     def get_all_speakers(self) -> List[Speaker]:
         """Get all speakers"""
@@ -40,6 +45,7 @@ class SpeakerService:
         for key, value in speaker_data_dict.items():
             setattr(speaker, key, value)
         
+        changes.record("speaker", "updated", speaker)
         return speaker
     
     def delete_speaker(self, speaker_id: int) -> bool:
@@ -49,6 +55,9 @@ class SpeakerService:
             return False
         
         speakers.remove(speaker)
+        del speakers_by_id[speaker_id]
+        schedule_service.remove_speaker(speaker_id)
+        changes.record("speaker", "deleted", speaker)
         return True
     
     def search_speakers_by_name(self, name_query: str) -> List[Speaker]:
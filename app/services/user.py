@@ -2,7 +2,7 @@ from typing import List, Optional
 from fastapi import HTTPException, status
 
 from app.models import User
-from app.database import users, registrations
+from app.database import users, active_users, registrations, changes
 from app.schemas.user import UserCreate, UserUpdate
 
 
@@ -24,6 +24,8 @@ class UserService:
         
         user = User(id=new_id, name=user_data.name, email=user_data.email)
         users.append(user)
+        active_users[user.id] = user
+        changes.record("user", "created", user)
         return user
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
@@ -43,7 +45,7 @@ class UserService:
     def get_all_users(self, active_only: bool = True) -> List[User]:
         """Get all users"""
         if active_only:
-            filtered_users = [u for u in users if u.is_active]
+            filtered_users = list(active_users.values())
         else:
             filtered_users = users
         
@@ -86,6 +88,7 @@ class UserService:
         if user_data.email is not None:
             user.email = user_data.email
         
+        changes.record("user", "updated", user)
         return user
     
     def delete_user(self, user_id: int) -> bool:
@@ -95,6 +98,8 @@ class UserService:
             return False
         
         user.is_active = False
+        active_users.pop(user.id, None)
+        changes.record("user", "deleted", user)
         return True
     
     def search_users_by_name(self, name_query: str) -> List[User]:
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import httpx
+
+from app.changelog import ChangeLog
+from app.database import changes
+from app.main import app
+
+
+class Record:
+    def __init__(self, id: int):
+        self.id = id
+
+
+def filled_log(maxlen: int, count: int) -> ChangeLog:
+    log = ChangeLog(maxlen=maxlen)
+    for index in range(1, count + 1):
+        log.record("user", "created", Record(index))
+    return log
+
+
+def test_since_returns_none_after_eviction():
+    log = filled_log(maxlen=3, count=5)
+
+    # Sequences 1 and 2 were evicted, so resuming after 0 or 1 would skip changes
+    assert log.since(0, 10) is None
+    assert log.since(1, 10) is None
+    assert [change.sequence for change in log.since(2, 10)] == [3, 4, 5]
+
+
+def test_since_returns_none_for_cursor_ahead_of_latest():
+    log = filled_log(maxlen=3, count=2)
+
+    assert log.since(3, 10) is None
+    assert log.since(2, 10) == []
+
+
+def test_resume_with_since_and_limit():
+    log = filled_log(maxlen=10, count=6)
+
+    first = log.since(0, 2)
+    assert [change.sequence for change in first] == [1, 2]
+    resumed = log.since(first[-1].sequence, 3)
+    assert [change.sequence for change in resumed] == [3, 4, 5]
+    assert [change.entity_id for change in resumed] == [3, 4, 5]
+    assert log.last_sequence == 6
+
+
+def test_wait_wakes_on_record_from_worker_thread():
+    log = filled_log(maxlen=10, count=1)
+
+    async def run():
+        timer = threading.Timer(0.05, log.record, args=("user", "updated", Record(1)))
+        timer.start()
+        try:
+            return await log.wait(1, timeout=2)
+        finally:
+            timer.join()
+
+    assert asyncio.run(run()) is True
+    assert [change.action for change in log.since(1, 10)] == ["updated"]
+
+
+def test_wait_returns_false_on_timeout():
+    log = filled_log(maxlen=10, count=1)
+
+    assert asyncio.run(log.wait(1, timeout=0.05)) is False
+    assert asyncio.run(log.wait(0, timeout=0.05)) is True
+
+
+def test_feed_returns_410_for_unretained_cursor():
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/changes/", params={"since": changes.last_sequence + 1})
+
+    response = asyncio.run(run())
+    assert response.status_code == 410
+    assert response.json()["error"]["type"] == "http_error"
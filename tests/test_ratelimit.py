@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from app.ratelimit import RateLimiter, RateLimitMiddleware, TokenBucket
+
+BUDGETS = [
+    ("POST", r"^/registrations/\d+/register/\d+$", 5, 3),
+    ("GET", r"^/users/search$", 5, 3),
+]
+
+
+def create_app(max_in_flight: int = 100, api_keys: frozenset = frozenset(), default=(100, 100)):
+    application = FastAPI()
+
+    @application.post("/registrations/{event_id}/register/{user_id}")
+    async def register(event_id: int, user_id: int):
+        return {"ok": True}
+
+    @application.get("/users/search")
+    async def search():
+        return {"ok": True}
+
+    @application.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    return RateLimitMiddleware(
+        application,
+        limiter=RateLimiter(BUDGETS, default),
+        max_in_flight=max_in_flight,
+        api_keys=api_keys,
+    )
+
+
+def client_for(middleware: RateLimitMiddleware) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=middleware), base_url="http://test")
+
+
+def test_burst_over_limit_returns_429_with_retry_after():
+    async def run():
+        async with client_for(create_app()) as client:
+            responses = await asyncio.gather(
+                *[client.post("/registrations/1/register/1") for _ in range(5)]
+            )
+        return responses
+
+    responses = asyncio.run(run())
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200, 200, 200, 429, 429]
+
+    rejected = next(response for response in responses if response.status_code == 429)
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert rejected.json() == {"error": {"detail": "Rate limit exceeded", "type": "http_error"}}
+
+
+def test_tokens_refill_over_time():
+    bucket = TokenBucket(rate=2, capacity=1, now=0.0)
+    assert bucket.consume(0.0) == 0
+    assert bucket.consume(0.1) > 0
+    assert bucket.consume(0.6) == 0
+
+    async def run():
+        async with client_for(create_app()) as client:
+            burst = [await client.post("/registrations/1/register/1") for _ in range(4)]
+            await asyncio.sleep(0.25)
+            return burst, await client.post("/registrations/1/register/1")
+
+    burst, after_refill = asyncio.run(run())
+    assert burst[-1].status_code == 429
+    assert after_refill.status_code == 200
+
+
+def test_route_budgets_are_independent():
+    async def run():
+        async with client_for(create_app()) as client:
+            registrations = [await client.post("/registrations/1/register/1") for _ in range(4)]
+            searches = [await client.get("/users/search") for _ in range(3)]
+            return registrations, searches
+
+    registrations, searches = asyncio.run(run())
+    assert registrations[-1].status_code == 429
+    assert [response.status_code for response in searches] == [200, 200, 200]
+
+
+def test_rotating_untrusted_api_keys_share_the_ip_bucket():
+    async def run():
+        async with client_for(create_app(api_keys=frozenset({"trusted"}))) as client:
+            rotated = [
+                await client.post("/registrations/1/register/1", headers={"X-API-Key": f"k{i}"})
+                for i in range(4)
+            ]
+            trusted = await client.post("/registrations/1/register/1", headers={"X-API-Key": "trusted"})
+            return rotated, trusted
+
+    rotated, trusted = asyncio.run(run())
+    assert [response.status_code for response in rotated] == [200, 200, 200, 429]
+    assert trusted.status_code == 200
+
+
+def test_concurrent_requests_past_max_in_flight_get_503():
+    middleware = create_app(max_in_flight=3)
+
+    async def run():
+        async with client_for(middleware) as client:
+            return await asyncio.gather(*[client.get("/slow") for _ in range(6)])
+
+    responses = asyncio.run(run())
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200, 200, 200, 503, 503, 503]
+    assert all("Retry-After" in r.headers for r in responses if r.status_code == 503)
+    assert middleware.in_flight == 0
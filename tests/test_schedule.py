@@ -0,0 +1,186 @@
+import asyncio
+import threading
+from datetime import date
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.database import (
+    events, open_events, closed_events, archived_events,
+    registrations, registrations_by_id, archived_registrations,
+    speakers, speakers_by_id, speaker_assignments, event_assignments,
+    schedule_by_speaker, schedule_by_location, schedule_by_date,
+)
+from app.main import app
+from app.schemas.event import EventCreate, EventUpdate
+from app.services.event import EventService
+from app.services.schedule import ScheduleService
+from app.services.speaker import SpeakerService
+
+event_service = EventService()
+schedule_service = ScheduleService()
+speaker_service = SpeakerService()
+
+MONDAY = date(2030, 1, 7)
+TUESDAY = date(2030, 1, 8)
+
+
+def clear_stores():
+    for store in (
+        events, open_events, closed_events, archived_events,
+        registrations, registrations_by_id, archived_registrations,
+        speaker_assignments, event_assignments,
+        schedule_by_speaker, schedule_by_location, schedule_by_date,
+    ):
+        store.clear()
+
+
+@pytest.fixture(autouse=True)
+def clean_schedule():
+    saved_speakers = list(speakers)
+    clear_stores()
+    yield
+    clear_stores()
+    speakers[:] = saved_speakers
+    speakers_by_id.clear()
+    speakers_by_id.update({speaker.id: speaker for speaker in saved_speakers})
+
+
+def create_event(location: str, day: date):
+    return event_service.create_event(EventCreate(title="Session", location=location, date=day))
+
+
+def assert_indexes_consistent():
+    """Rebuild every index from the assignments and compare with the live ones"""
+    by_speaker, by_location, by_date = {}, {}, []
+    for assignment in speaker_assignments.values():
+        event = event_service.get_event_by_id(assignment.event_id)
+        entry = (event.date, assignment.id)
+        by_speaker.setdefault(assignment.speaker_id, []).append(entry)
+        by_location.setdefault(event.location.lower(), []).append(entry)
+        by_date.append(entry)
+
+    assert {k: v for k, v in schedule_by_speaker.items() if v} == {k: sorted(v) for k, v in by_speaker.items()}
+    assert {k: v for k, v in schedule_by_location.items() if v} == {k: sorted(v) for k, v in by_location.items()}
+    assert schedule_by_date == sorted(by_date)
+    assert sorted(a.id for assigned in event_assignments.values() for a in assigned) == sorted(speaker_assignments)
+
+
+def speaker_ids(result):
+    return [speaker.id for speaker in result]
+
+
+def test_assign_and_unassign_keep_indexes_consistent():
+    lagos = create_event("Lagos", MONDAY)
+    abuja = create_event("Abuja", TUESDAY)
+
+    schedule_service.assign_speaker(1, lagos.id)
+    schedule_service.assign_speaker(2, lagos.id)
+    schedule_service.assign_speaker(1, abuja.id)
+    assert_indexes_consistent()
+    assert [event.id for event in schedule_service.get_speaker_events(1)] == [lagos.id, abuja.id]
+
+    assert schedule_service.unassign_speaker(1, lagos.id) is True
+    assert schedule_service.unassign_speaker(1, lagos.id) is False
+    assert_indexes_consistent()
+    assert speaker_ids(schedule_service.get_event_speakers(lagos.id)) == [2]
+
+
+def test_double_booking_and_repeat_assignment_return_409():
+    lagos = create_event("Lagos", MONDAY)
+    abuja = create_event("Abuja", MONDAY)
+    same_venue = create_event("lagos", MONDAY)
+
+    schedule_service.assign_speaker(1, lagos.id)
+    for speaker_id, event_id in ((1, abuja.id), (1, lagos.id)):
+        with pytest.raises(HTTPException) as error:
+            schedule_service.assign_speaker(speaker_id, event_id)
+        assert error.value.status_code == 409
+
+    # Another speaker at another event in the same venue is not a clash
+    schedule_service.assign_speaker(2, same_venue.id)
+    assert_indexes_consistent()
+
+
+def test_update_event_moves_bookings_and_409_leaves_event_unchanged():
+    lagos = create_event("Lagos", MONDAY)
+    abuja = create_event("Abuja", TUESDAY)
+    schedule_service.assign_speaker(1, lagos.id)
+    schedule_service.assign_speaker(1, abuja.id)
+
+    event_service.update_event(abuja.id, EventUpdate(location="Ibadan"))
+    assert schedule_by_location.get("abuja") == []
+    assert len(schedule_by_location["ibadan"]) == 1
+    assert_indexes_consistent()
+
+    async def move_onto_monday():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.put(
+                f"/events/{abuja.id}", json={"location": "Lagos", "date": MONDAY.isoformat()}
+            )
+
+    response = asyncio.run(move_onto_monday())
+    assert response.status_code == 409
+    assert (abuja.location, abuja.date) == ("Ibadan", TUESDAY)
+    assert_indexes_consistent()
+
+
+def test_remove_speaker_and_archive_drop_bookings():
+    lagos = create_event("Lagos", MONDAY)
+    abuja = create_event("Abuja", TUESDAY)
+    schedule_service.assign_speaker(1, lagos.id)
+    schedule_service.assign_speaker(2, lagos.id)
+    schedule_service.assign_speaker(2, abuja.id)
+
+    speaker_service.delete_speaker(2)
+    assert 2 not in schedule_by_speaker
+    assert speaker_ids(schedule_service.get_event_speakers(lagos.id)) == [1]
+    assert_indexes_consistent()
+
+    event_service.close_event(lagos.id)
+    archived = event_service.archive_closed_events(date(2031, 1, 1))
+    assert [event.id for event in archived] == [lagos.id]
+    assert speaker_assignments == {}
+    assert_indexes_consistent()
+
+
+def test_get_speakers_between_with_and_without_location():
+    lagos = create_event("Lagos", MONDAY)
+    abuja = create_event("Abuja", TUESDAY)
+    later = create_event("Lagos", date(2030, 2, 4))
+    schedule_service.assign_speaker(1, lagos.id)
+    schedule_service.assign_speaker(2, abuja.id)
+    schedule_service.assign_speaker(3, later.id)
+
+    assert speaker_ids(schedule_service.get_speakers_between(MONDAY)) == [1, 2]
+    assert speaker_ids(schedule_service.get_speakers_between(MONDAY, location="LAGOS")) == [1]
+    assert speaker_ids(schedule_service.get_speakers_between(TUESDAY, TUESDAY)) == [2]
+    assert speaker_ids(schedule_service.get_speakers_between(MONDAY, date(2030, 2, 28), "lagos")) == [1, 3]
+    assert schedule_service.get_speakers_between(MONDAY, location="Kano") == []
+
+
+def test_concurrent_assignments_cannot_double_book():
+    same_day = [create_event(f"Venue {index}", MONDAY) for index in range(8)]
+    barrier = threading.Barrier(len(same_day))
+    results = []
+
+    def assign(event_id: int):
+        barrier.wait()
+        try:
+            schedule_service.assign_speaker(1, event_id)
+            results.append(201)
+        except HTTPException as error:
+            results.append(error.status_code)
+
+    threads = [threading.Thread(target=assign, args=(event.id,)) for event in same_day]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [201] + [409] * 7
+    assert len(schedule_by_speaker[1]) == 1
+    assert_indexes_consistent()